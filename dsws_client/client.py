@@ -1,10 +1,25 @@
 """The DSWS client."""
 
+import collections
 import concurrent.futures
+import functools
 import itertools
 import logging
 import sys
-from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, Union
+import threading
+import time
+import warnings
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import httpx
 import msgspec
@@ -27,6 +42,7 @@ from dsws_client.ds_response import (
     DSGetTokenResponse,
 )
 from dsws_client.exceptions import (
+    DSWSError,
     InvalidResponseError,
     RequestFailedError,
 )
@@ -37,6 +53,52 @@ logger = logging.getLogger(__name__)
 
 ResponseCls = TypeVar("ResponseCls")
 
+# refresh the token this many seconds before it actually expires
+TOKEN_REFRESH_MARGIN = 30.0
+# refresh the token in the background once this share of its TTL has passed
+TOKEN_BACKGROUND_REFRESH_RATIO = 0.9
+
+# maximum number of response bytes to include in error messages
+MAX_ERROR_CONTENT_LENGTH = 512
+
+# placeholder for credentials in logged requests
+REDACTED = "***"
+
+_ENCODER = msgspec.json.Encoder()
+
+
+@functools.lru_cache(maxsize=None)
+def _decoder_for(
+    response_cls: Type[ResponseCls],
+) -> "msgspec.json.Decoder[ResponseCls]":
+    """Return a (cached) JSON decoder for a response type."""
+    return msgspec.json.Decoder(response_cls)
+
+
+def _truncate(content: bytes) -> str:
+    """Decode (the start of) a response body for an error message."""
+    text = content[:MAX_ERROR_CONTENT_LENGTH].decode("utf-8", errors="replace")
+    if len(content) > MAX_ERROR_CONTENT_LENGTH:
+        text += "..."
+    return text
+
+
+def _redact(request: DSRequest) -> DSRequest:
+    """Return a copy of a request with its credentials masked, for logging."""
+    if isinstance(request, DSGetTokenRequest):
+        return msgspec.structs.replace(request, password=REDACTED)
+    if isinstance(request, (DSGetDataRequest, DSGetDataBundleRequest)):
+        return msgspec.structs.replace(request, token_value=REDACTED)
+    return request
+
+
+def _enable_debug_logging() -> None:
+    """Log debug messages of the package to stdout."""
+    package_logger = logging.getLogger("dsws_client")
+    package_logger.setLevel(logging.DEBUG)
+    if not package_logger.handlers:
+        package_logger.addHandler(logging.StreamHandler(sys.stdout))
+
 
 class DSWSClient:
     """
@@ -58,12 +120,24 @@ class DSWSClient:
         data_source (optional): The data source to use in the request.
         max_concurrency (default: 1): The maximum number of concurrent
             requests to make.
-        debug (default: False): If True, print the request and response
-            data to stdout.
+        http2 (default: False): If True, use HTTP/2 so concurrent requests
+            share a single connection. Requires the `dsws-client[http2]`
+            extra.
+        debug (default: False): Deprecated, configure the `dsws_client`
+            logger instead. If True, log the (redacted) request and
+            response data to stdout.
     """
 
     def __init__(self, username: str, password: str, **kwargs: Any) -> None:
         config = DSWSConfig(**kwargs)
+        if config.debug:
+            warnings.warn(
+                "the `debug` option is deprecated, set the `dsws_client` "
+                "logger to the DEBUG level instead",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            _enable_debug_logging()
         self._username = username
         self._password = password
         self._session = httpx.Client(
@@ -72,19 +146,64 @@ class DSWSClient:
             proxies=config.proxies,  # type: ignore[arg-type]
             verify=config.ssl_cert or True,
             headers={"Content-Type": "application/json"},
+            http2=config.http2,
+            limits=httpx.Limits(
+                max_connections=max(100, config.max_concurrency * 2),
+                max_keepalive_connections=config.max_concurrency,
+                keepalive_expiry=60.0,
+            ),
         )
         self._max_concurrency = config.max_concurrency
-        self._app_id = config.app_id
-        self._data_source = config.data_source
-        self._debug = config.debug
-        self._token: Optional[Token] = None
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=config.max_concurrency,
+            thread_name_prefix="dsws",
+        )
+        self._base_properties = tuple(
+            DSStringKVPair(key, value)
+            for key, value in (
+                ("__AppId", config.app_id),
+                ("Source", config.data_source),
+            )
+            if value is not None
+        )
+        self._urls: Dict[str, httpx.URL] = {}
+        self._token_value = ""
+        self._token_deadline = float("-inf")
+        self._token_refresh_at = float("-inf")
+        self._token_lock = threading.Lock()
+        self._token_thread: Optional[threading.Thread] = None
+        self._token_thread_lock = threading.Lock()
+        self._closed = False
+
+    def __enter__(self) -> "DSWSClient":
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Exit the client context, closing the client."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the thread pool and close the HTTP session."""
+        with self._token_thread_lock:
+            self._closed = True
+            token_thread = self._token_thread
+        # let a running background refresh finish before closing the session
+        if token_thread is not None:
+            token_thread.join()
+        self._executor.shutdown()
+        self._session.close()
 
     @property
     def token(self) -> str:
         """Get a token."""
-        if self._token is None or self._token.is_expired:
-            self._token = self.fetch_token()
-        return self._token.token_value
+        now = time.monotonic()
+        if now < self._token_refresh_at:
+            return self._token_value
+        if now < self._token_deadline:
+            self._refresh_token_in_background()
+            return self._token_value
+        return self._refresh_token()
 
     def fetch_snapshot_data(
         self,
@@ -204,9 +323,7 @@ class DSWSClient:
             DSGetDataRequest(
                 token_value=self.token,
                 data_request=data_request,
-                properties=[
-                    DSStringKVPair(key, value) for key, value in kwargs.items()
-                ],
+                properties=self._make_properties(kwargs),
             ),
             DSGetDataResponse,
         )
@@ -231,9 +348,7 @@ class DSWSClient:
             DSGetDataBundleRequest(
                 token_value=self.token,
                 data_requests=data_requests,
-                properties=[
-                    DSStringKVPair(key, value) for key, value in kwargs.items()
-                ],
+                properties=self._make_properties(kwargs),
             ),
             DSGetDataBundleResponse,
         )
@@ -256,15 +371,23 @@ class DSWSClient:
         request_bundles: List[List[DSDataRequest]],
     ) -> Iterator[DSGetDataBundleResponse]:
         """Fetch as many bundles as needed to get all items (concurrently)."""
-        with concurrent.futures.ThreadPoolExecutor(
-            max_workers=self._max_concurrency
-        ) as executor:
-            logger.debug("fetching bundles in parallel")
-            futures = [
-                executor.submit(self.fetch_bundle, bundle) for bundle in request_bundles
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                yield future.result()
+        # prime the token so the workers don't race to fetch it
+        _ = self.token
+        logger.debug("fetching bundles in parallel")
+        # keep a bounded number of bundles in flight, yielding in order
+        bundles = iter(request_bundles)
+        pending: Deque[concurrent.futures.Future[DSGetDataBundleResponse]] = (
+            collections.deque(
+                self._executor.submit(self.fetch_bundle, bundle)
+                for bundle in itertools.islice(bundles, 2 * self._max_concurrency)
+            )
+        )
+        while pending:
+            response = pending.popleft().result()
+            next_bundle = next(bundles, None)
+            if next_bundle is not None:
+                pending.append(self._executor.submit(self.fetch_bundle, next_bundle))
+            yield response
 
     def fetch_token(self, **kwargs: object) -> Token:
         """
@@ -280,9 +403,7 @@ class DSWSClient:
             DSGetTokenRequest(
                 self._username,
                 self._password,
-                properties=[
-                    DSStringKVPair(key, value) for key, value in kwargs.items()
-                ],
+                properties=self._make_properties(kwargs),
             ),
             DSGetTokenResponse,
         )
@@ -351,15 +472,13 @@ class DSWSClient:
         ]
         date = DSDate.construct(start, end, frequency, kind)
         identifier_bundles = bundle_identifiers(instrument, len(data_types))
-        request_bundles = []
-        for identifier_bundle in identifier_bundles:
-            data_requests = []
-            for instrument in identifier_bundle:
-                data_requests.append(
-                    DSDataRequest(instrument, data_types, date, tag=tag)
-                )
-            request_bundles.append(data_requests)
-        return request_bundles
+        return [
+            [
+                DSDataRequest(bundle_instrument, data_types, date, tag)
+                for bundle_instrument in identifier_bundle
+            ]
+            for identifier_bundle in identifier_bundles
+        ]
 
     def _execute_request(
         self,
@@ -368,29 +487,81 @@ class DSWSClient:
     ) -> ResponseCls:
         """Execute a request."""
         logger.debug("executing request")
-        self._prep_request(request)
-        request_data = msgspec.json.encode(request)
-        if self._debug:
-            sys.stdout.write(f"sending request: {request_data!s}")
-        response = self._session.post(
-            request.path,
+        request_data = _ENCODER.encode(request)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("sending request: %r", _redact(request))
+        http_request = self._session.build_request(
+            "POST",
+            self._url_for(request.path),
             content=request_data,
         )
+        response = self._session.send(http_request)
+        response_content = response.content
         if not response.is_success:
-            msg = f"request failed: {response.text}"
+            msg = f"request failed: {_truncate(response_content)}"
             raise RequestFailedError(msg, response.status_code)
+        decoder: msgspec.json.Decoder[ResponseCls] = _decoder_for(response_cls)  # type: ignore[arg-type]
         try:
-            response_decoded = msgspec.json.decode(response.content, type=response_cls)
+            response_decoded = decoder.decode(response_content)
         except (msgspec.ValidationError, ValueError, TypeError) as exc:
-            msg = f"invalid response: {response.text}"
+            msg = f"invalid response: {_truncate(response_content)}"
             raise InvalidResponseError(msg) from exc
-        if self._debug:
-            sys.stdout.write(f"received response: {response_decoded!s}")
+        if isinstance(response_decoded, DSGetTokenResponse):
+            logger.debug("received token response")
+        else:
+            logger.debug("received response: %r", response_decoded)
         return response_decoded
 
-    def _prep_request(self, request: DSRequest) -> None:
-        """Prepare a request."""
-        if self._app_id is not None:
-            request.properties.append(DSStringKVPair("__AppId", self._app_id))
-        if self._data_source is not None:
-            request.properties.append(DSStringKVPair("Source", self._data_source))
+    def _refresh_token(self) -> str:
+        """Fetch a new token, unless another thread already did."""
+        with self._token_lock:
+            if time.monotonic() >= self._token_refresh_at:
+                token = self.fetch_token()
+                now = time.monotonic()
+                ttl = token.ttl_seconds
+                self._token_value = token.token_value
+                self._token_deadline = now + ttl - TOKEN_REFRESH_MARGIN
+                self._token_refresh_at = min(
+                    now + ttl * TOKEN_BACKGROUND_REFRESH_RATIO,
+                    self._token_deadline,
+                )
+            return self._token_value
+
+    def _refresh_token_in_background(self) -> None:
+        """Refresh the token in a background thread, if not already refreshing."""
+        if self._token_lock.locked():
+            return
+        with self._token_thread_lock:
+            if self._closed or (
+                self._token_thread is not None and self._token_thread.is_alive()
+            ):
+                return
+            self._token_thread = threading.Thread(
+                target=self._background_token_refresh,
+                name="dsws-token-refresh",
+                daemon=True,
+            )
+            self._token_thread.start()
+
+    def _background_token_refresh(self) -> None:
+        """Refresh the token, logging instead of raising errors."""
+        try:
+            self._refresh_token()
+        except (DSWSError, httpx.HTTPError):
+            logger.warning("background token refresh failed", exc_info=True)
+
+    def _url_for(self, path: str) -> httpx.URL:
+        """Return the (cached) absolute URL for an endpoint path."""
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = self._session.base_url.join(path)
+        return url
+
+    def _make_properties(self, kwargs: Dict[str, object]) -> List[DSStringKVPair]:
+        """Make the request properties from kwargs and the client defaults."""
+        if not kwargs:
+            return list(self._base_properties)
+        return [
+            *(DSStringKVPair(key, value) for key, value in kwargs.items()),
+            *self._base_properties,
+        ]
@@ -1,3 +1,4 @@
+import functools
 import os
 import urllib.parse
 from typing import Any, ClassVar, Dict, Optional
@@ -9,7 +10,13 @@ from dotenv import load_dotenv
 from dsws_client.version import __version__
 
 
-@attrs.define()
+@functools.lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    """Load environment variables from a `.env` file (once per process)."""
+    load_dotenv()
+
+
+@attrs.define(frozen=True)
 class DSWSConfig:
     """Configuration for the DSWS client."""
 
@@ -20,18 +27,19 @@ class DSWSConfig:
     ssl_cert: Optional[str] = None
     app_id: str = f"dsws-client-{__version__}"
     data_source: Optional[str] = None
-    max_concurrency: int = 1
+    max_concurrency: int = attrs.field(default=1, converter=int)
+    http2: bool = attrs.field(default=False, converter=attrs.converters.to_bool)
     debug: bool = attrs.field(default=False, converter=attrs.converters.to_bool)
 
     def __init__(self, **kwargs: Any) -> None:
         """Load configuration from environment variables."""
-        load_dotenv()
+        _load_dotenv()
         init_dict = {}
-        for field in attrs.fields(DSWSConfig):
+        for name, env_name in _FIELD_ENV_NAMES:
             # try to get the value from kwargs, then from environment variables
-            value = kwargs.get(field.name, os.getenv(field.name.upper()))
+            value = kwargs.get(name, os.getenv(env_name))
             if value is not None:
-                init_dict[field.name] = value
+                init_dict[name] = value
         self.__attrs_init__(**init_dict)  # type: ignore[attr-defined]
 
     @property
@@ -44,3 +52,8 @@ class DSWSConfig:
         """Return the proxies."""
         proxy = httpx.HTTPTransport(proxy=self.proxy)
         return {"https://": proxy, "http://": proxy} if self.proxy else None
+
+
+_FIELD_ENV_NAMES = tuple(
+    (field.name, field.name.upper()) for field in attrs.fields(DSWSConfig)
+)
@@ -1,21 +1,50 @@
 import datetime as dt
+import functools
 import re
 from typing import Union
 
+_TIMESTAMP_RE = re.compile(r"(-?\d+)(?:([+-])(\d{2})(\d{2}))?")
+_DATE_PREFIX = "/Date("
+_DATE_SUFFIX = ")/"
+_OFFSET_LENGTH = 5
 
+
+@functools.lru_cache(maxsize=4096)
 def convert_date(date_str: Union[str, dt.datetime]) -> dt.datetime:
     """Convert a timestamp from Datastream to datetime."""
     if isinstance(date_str, dt.datetime):
         return date_str
-    match = re.search(r"[0-9+]+", date_str)
+    # fast path for the fixed "/Date([-]<millis>[+-HHMM])/" format
+    if date_str.startswith(_DATE_PREFIX) and date_str.endswith(_DATE_SUFFIX):
+        timestamp = date_str[len(_DATE_PREFIX) : -len(_DATE_SUFFIX)]
+        if _is_millis(timestamp):
+            return _from_millis(timestamp, "+0000")
+        timestamp, offset = timestamp[:-_OFFSET_LENGTH], timestamp[-_OFFSET_LENGTH:]
+        if _is_millis(timestamp) and offset[0] in "+-" and offset[1:].isdigit():
+            return _from_millis(timestamp, offset)
+    match = _TIMESTAMP_RE.search(date_str)
     if match is None:
         msg = f"invalid date string: {date_str}"
         raise ValueError(msg)
-    timestamp = match.group(0)
-    tzinfo = dt.timezone.utc
-    if "+" in timestamp:
-        timestamp, offset = timestamp.split("+")
-        timedelta = dt.timedelta(hours=int(offset[:2]), minutes=int(offset[2:]))
-        tzinfo = dt.timezone(timedelta)
-    timestamp_int = int(timestamp)
-    return dt.datetime.fromtimestamp(timestamp_int / 1000, tz=tzinfo)
+    timestamp, sign, hours, minutes = match.groups()
+    offset = "+0000" if sign is None else f"{sign}{hours}{minutes}"
+    return _from_millis(timestamp, offset)
+
+
+def _is_millis(value: str) -> bool:
+    """Return True if a string is a (possibly negative) integer."""
+    return value[1:].isdigit() if value.startswith("-") else value.isdigit()
+
+
+def _from_millis(timestamp: str, offset: str) -> dt.datetime:
+    """Convert milliseconds since the epoch and a UTC offset to datetime."""
+    return dt.datetime.fromtimestamp(int(timestamp) / 1000, tz=_timezone(offset))
+
+
+@functools.lru_cache(maxsize=None)
+def _timezone(offset: str) -> dt.timezone:
+    """Return the timezone for a "+HHMM"/"-HHMM" UTC offset."""
+    if offset in {"+0000", "-0000"}:
+        return dt.timezone.utc
+    delta = dt.timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+    return dt.timezone(-delta if offset[0] == "-" else delta)
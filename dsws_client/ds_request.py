@@ -3,14 +3,12 @@
 import datetime as dt
 import sys
 from typing import (
-    Any,
     ClassVar,
     Dict,
     List,
     Optional,
     Protocol,
     Tuple,
-    TypeVar,
     Union,
 )
 
@@ -44,9 +42,15 @@ _HINT_MAP = {
     "L": DSStringKVPair(enums.DSInstrumentPropertyName.INSTRUMENT_LIST, value=True),
     "E": DSStringKVPair(enums.DSInstrumentPropertyName.EXPRESSION, value=True),
 }
+_SYMBOL_SET_PROPERTY = DSStringKVPair(
+    enums.DSInstrumentPropertyName.SYMBOL_SET, value=True
+)
+_RETURN_NAME_PROPERTY = DSStringKVPair(
+    enums.DSInstrumentPropertyName.RETURN_NAME, value=True
+)
 
 
-class DSGetTokenRequest(msgspec.Struct, rename="pascal"):
+class DSGetTokenRequest(msgspec.Struct, rename="pascal", gc=False):
     """Object that defines a token request."""
 
     path: ClassVar[str] = "GetToken"
@@ -59,7 +63,7 @@ class DSGetTokenRequest(msgspec.Struct, rename="pascal"):
         self.properties.append(DSStringKVPair(key, value))
 
 
-class DSInstrument(msgspec.Struct, rename="pascal"):
+class DSInstrument(msgspec.Struct, rename="pascal", gc=False):
     """Object that defines an instrument."""
 
     value: str
@@ -67,7 +71,7 @@ class DSInstrument(msgspec.Struct, rename="pascal"):
 
     def __len__(self) -> int:
         """Return the number of identifiers."""
-        return len(self.identifiers)
+        return self.value.count(",") + 1
 
     @property
     def identifiers(self) -> List[str]:
@@ -78,10 +82,7 @@ class DSInstrument(msgspec.Struct, rename="pascal"):
     @classmethod
     def from_list(cls, instrument_list: List[str]) -> "DSInstrument":
         """Return an instrument from a list of instrument names."""
-        properties = [
-            DSStringKVPair(enums.DSInstrumentPropertyName.SYMBOL_SET, value=True)
-        ]
-        return cls(",".join(instrument_list), properties)
+        return cls(",".join(instrument_list), [_SYMBOL_SET_PROPERTY])
 
     @classmethod
     def construct(
@@ -92,25 +93,22 @@ class DSInstrument(msgspec.Struct, rename="pascal"):
     ) -> "DSInstrument":
         """Return an instrument."""
         if isinstance(identifiers, list):
-            instance = cls.from_list(identifiers)
+            value = ",".join(identifiers)
+            instance_properties = [_SYMBOL_SET_PROPERTY]
         else:
-            value = identifiers
-            hint_properties = []
-            if "|" in value:
-                value, hint = identifiers.split("|")
-                hint_properties.append(_HINT_MAP[hint])
-            instance = cls(value, hint_properties)
+            value, _, hint = identifiers.partition("|")
+            instance_properties = [_HINT_MAP[hint]] if hint else []
         if return_names:
-            instance.properties.append(
-                DSStringKVPair(enums.DSInstrumentPropertyName.RETURN_NAME, value=True)
+            instance_properties.append(_RETURN_NAME_PROPERTY)
+        if properties:
+            instance_properties.extend(
+                DSStringKVPair(key, property_value)
+                for key, property_value in properties.items()
             )
-        properties = properties or {}
-        for key, value in properties.items():
-            instance.properties.append(DSStringKVPair(key, value))
-        return instance
+        return cls(value, instance_properties)
 
 
-class DSDataType(msgspec.Struct, rename="pascal"):
+class DSDataType(msgspec.Struct, rename="pascal", gc=False):
     """A data type (field)."""
 
     value: str
@@ -124,16 +122,17 @@ class DSDataType(msgspec.Struct, rename="pascal"):
         properties: Optional[Dict[str, str]] = None,
     ) -> "DSDataType":
         """Construct a data type."""
-        instance = cls(field)
+        data_type_properties = []
         if return_name:
-            instance.properties.append(DSStringKVPair("ReturnName", value=True))
-        properties = properties or {}
-        for key, value in properties.items():
-            instance.properties.append(DSStringKVPair(key, value))
-        return instance
+            data_type_properties.append(_RETURN_NAME_PROPERTY)
+        if properties:
+            data_type_properties.extend(
+                DSStringKVPair(key, value) for key, value in properties.items()
+            )
+        return cls(field, data_type_properties)
 
 
-class DSDate(msgspec.Struct, rename="pascal"):
+class DSDate(msgspec.Struct, rename="pascal", gc=False):
     """Date information."""
 
     start: str
@@ -172,7 +171,7 @@ class DSDate(msgspec.Struct, rename="pascal"):
         return date.value
 
 
-class DSDataRequest(msgspec.Struct, rename="pascal"):
+class DSDataRequest(msgspec.Struct, rename="pascal", gc=False):
     """Object that defines a data request."""
 
     instrument: DSInstrument
@@ -182,23 +181,22 @@ class DSDataRequest(msgspec.Struct, rename="pascal"):
 
     def __post_init__(self) -> None:
         """Validate that a request complies with DSWS request limits."""
-        if len(self.instrument.identifiers) > MAX_INSTRUMENTS_PER_REQUEST:
+        n_instruments = len(self.instrument)
+        n_data_types = len(self.data_types)
+        if n_instruments > MAX_INSTRUMENTS_PER_REQUEST:
             msg = (
                 f"Request contains more than {MAX_INSTRUMENTS_PER_REQUEST} instruments."
             )
             raise ValueError(msg)
-        if len(self.data_types) > MAX_DATATYPES_PER_REQUEST:
+        if n_data_types > MAX_DATATYPES_PER_REQUEST:
             msg = f"Request contains more than {MAX_DATATYPES_PER_REQUEST} data types."
             raise ValueError(msg)
-        if (
-            len(self.instrument.identifiers) * len(self.data_types)
-            > MAX_ITEMS_PER_REQUEST
-        ):
+        if n_instruments * n_data_types > MAX_ITEMS_PER_REQUEST:
             msg = f"Request contains more than {MAX_ITEMS_PER_REQUEST} items."
             raise ValueError(msg)
 
 
-class DSGetDataRequest(msgspec.Struct, rename="pascal"):
+class DSGetDataRequest(msgspec.Struct, rename="pascal", gc=False):
     """Object that contains a data request."""
 
     path: ClassVar[str] = "GetData"
@@ -211,7 +209,7 @@ class DSGetDataRequest(msgspec.Struct, rename="pascal"):
         self.properties.append(DSStringKVPair(key, value))
 
 
-class DSGetDataBundleRequest(msgspec.Struct, rename="pascal"):
+class DSGetDataBundleRequest(msgspec.Struct, rename="pascal", gc=False):
     """Object that contains multiple data requests."""
 
     path: ClassVar[str] = "GetDataBundle"
@@ -224,34 +222,18 @@ class DSGetDataBundleRequest(msgspec.Struct, rename="pascal"):
         if len(self.data_requests) > MAX_REQUESTS_PER_BUNDLE:
             msg = f"Bundle contains more than {MAX_REQUESTS_PER_BUNDLE} requests."
             raise ValueError(msg)
-        total_items = sum(
-            len(request.instrument.identifiers) * len(request.data_types)
-            for request in self.data_requests
-        )
-        if total_items > MAX_ITEMS_PER_BUNDLE:
-            msg = f"Bundle contains more than {MAX_ITEMS_PER_BUNDLE} items."
-            raise ValueError(msg)
+        total_items = 0
+        for request in self.data_requests:
+            total_items += len(request.instrument) * len(request.data_types)
+            if total_items > MAX_ITEMS_PER_BUNDLE:
+                msg = f"Bundle contains more than {MAX_ITEMS_PER_BUNDLE} items."
+                raise ValueError(msg)
 
     def add_property(self, key: str, value: str) -> None:
         """Add a property to the request."""
         self.properties.append(DSStringKVPair(key, value))
 
 
-T = TypeVar("T", bound=msgspec.Struct)
-
-
-def evolve(instance: T, **changes: object) -> T:
-    """Evolve an instance."""
-
-    def get_field(name: str) -> Any:
-        """Return the field."""
-        return changes.get(name, getattr(instance, name))
-
-    return instance.__class__(
-        **{field: get_field(field) for field in instance.__struct_fields__}
-    )
-
-
 def bundle_identifiers(
     instrument: DSInstrument,
     n_fields: int,
@@ -272,17 +254,15 @@ def bundle_identifiers(
     if n_fields > MAX_DATATYPES_PER_REQUEST:
         raise ValueError("Number of fields exceeds maximum allowed.")
     identifiers = instrument.identifiers
-    bundles = []
     n_identifiers_per_batch = MAX_ITEMS_PER_BUNDLE // n_fields
-    for batch_idx in range(0, len(identifiers), n_identifiers_per_batch):
-        batch_identifiers = identifiers[batch_idx : batch_idx + n_identifiers_per_batch]
-        bundles.append(
-            split_bundle_identifiers(
-                evolve(instrument, value=",".join(batch_identifiers)),
-                n_fields,
-            )
+    return [
+        _split_identifiers(
+            instrument,
+            identifiers[batch_idx : batch_idx + n_identifiers_per_batch],
+            n_fields,
         )
-    return bundles
+        for batch_idx in range(0, len(identifiers), n_identifiers_per_batch)
+    ]
 
 
 def split_bundle_identifiers(
@@ -299,17 +279,29 @@ def split_bundle_identifiers(
     Returns:
         Tuple of DSInstruments.
     """
-    identifiers = bundle_instrument.identifiers
-    request_bundles = []
+    return _split_identifiers(
+        bundle_instrument,
+        bundle_instrument.identifiers,
+        n_fields,
+    )
+
+
+def _split_identifiers(
+    instrument: DSInstrument,
+    identifiers: List[str],
+    n_fields: int,
+) -> Tuple[DSInstrument, ...]:
+    """Split a list of identifiers into instruments of request size."""
     n_identifiers_per_request = min(
         MAX_INSTRUMENTS_PER_REQUEST,
         MAX_ITEMS_PER_REQUEST // n_fields,
     )
-    for request_idx in range(0, len(identifiers), n_identifiers_per_request):
-        bundle_request_identifiers = identifiers[
-            request_idx : request_idx + n_identifiers_per_request
-        ]
-        request_bundles.append(
-            evolve(bundle_instrument, value=",".join(bundle_request_identifiers))
+    return tuple(
+        msgspec.structs.replace(
+            instrument,
+            value=",".join(
+                identifiers[request_idx : request_idx + n_identifiers_per_request]
+            ),
         )
-    return tuple(request_bundles)
+        for request_idx in range(0, len(identifiers), n_identifiers_per_request)
+    )
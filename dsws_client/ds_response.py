@@ -29,7 +29,7 @@ BOOL_MAPPING = {
 
 DSDateString = Annotated[
     str,
-    msgspec.Meta(pattern=r"\/Date\((\d+)([+-]\d{4})?\)\/"),
+    msgspec.Meta(pattern=r"\/Date\((-?\d+)([+-]\d{4})?\)\/"),
 ]
 
 
@@ -122,7 +122,7 @@ class DSBoolArray(
 
     def parse(self) -> List[bool]:
         """Parse the value."""
-        return [BOOL_MAPPING[item] for item in self.value]
+        return list(map(BOOL_MAPPING.__getitem__, self.value))
 
 
 class DSIntArray(
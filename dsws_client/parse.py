@@ -1,7 +1,6 @@
-import collections
 import datetime as dt
 import logging
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
 
 import msgspec
 
@@ -12,13 +11,21 @@ from dsws_client.ds_response import (
     DSSymbolResponseValue,
 )
 from dsws_client.exceptions import InvalidResponseError
+from dsws_client.value_objects import DSStringKVPair
 
 logger = logging.getLogger(__name__)
 
-RecordDict = Dict[Tuple[str, dt.datetime], Dict[str, Any]]
+# records per symbol, one (possibly empty) record per response date
+RecordDict = Dict[str, List[Dict[str, Any]]]
 
+STRING_VALUE_MAPPING: Dict[str, Optional[bool]] = {
+    "NA": None,
+    "N": False,
+    "Y": True,
+}
 
-class Error(msgspec.Struct):
+
+class Error(msgspec.Struct, gc=False):
     """Error object."""
 
     field: str
@@ -33,22 +40,38 @@ class Meta(msgspec.Struct):
     symbol_names: Dict[str, str] = msgspec.field(default_factory=dict)
     additional_responses: Dict[str, str] = msgspec.field(default_factory=dict)
     tags: List[str] = msgspec.field(default_factory=list)
-    currencies: Dict[str, Dict[str, Optional[str]]] = msgspec.field(
-        default_factory=lambda: collections.defaultdict(dict)
-    )
+    currencies: Dict[str, Dict[str, str]] = msgspec.field(default_factory=dict)
 
     def merge(self, other: "Meta") -> "Meta":
         """Merge this meta object with another one."""
-        return Meta(
-            data_type_names={**self.data_type_names, **other.data_type_names},
-            symbol_names={**self.symbol_names, **other.symbol_names},
-            additional_responses={
-                **self.additional_responses,
-                **other.additional_responses,
+        merged = Meta(
+            data_type_names=dict(self.data_type_names),
+            symbol_names=dict(self.symbol_names),
+            additional_responses=dict(self.additional_responses),
+            tags=list(self.tags),
+            currencies={
+                symbol: dict(symbol_currencies)
+                for symbol, symbol_currencies in self.currencies.items()
             },
-            tags=list({*self.tags, *other.tags}),
-            currencies={**self.currencies, **other.currencies},
         )
+        merged.update(other)
+        return merged
+
+    def update(self, other: "Meta") -> None:
+        """Update this meta object in place with another one."""
+        self._update(other, set(self.tags))
+
+    def _update(self, other: "Meta", seen_tags: Set[str]) -> None:
+        """Update in place, tracking the tags already in `self.tags`."""
+        self.data_type_names.update(other.data_type_names)
+        self.symbol_names.update(other.symbol_names)
+        self.additional_responses.update(other.additional_responses)
+        for tag in other.tags:
+            if tag not in seen_tags:
+                seen_tags.add(tag)
+                self.tags.append(tag)
+        for symbol, symbol_currencies in other.currencies.items():
+            self.currencies.setdefault(symbol, {}).update(symbol_currencies)
 
 
 class ParsedResponse(msgspec.Struct):
@@ -78,10 +101,12 @@ def responses_to_records(
 def aggregate_responses(responses: Iterable[ParsedResponse]) -> ParsedResponse:
     """Aggregate a list of parsed responses into a single response."""
     parsed_response = ParsedResponse()
+    # shared across responses so each tag is only looked up in a set
+    seen_tags: Set[str] = set()
     for response in responses:
         parsed_response.records.extend(response.records)
         parsed_response.errors.extend(response.errors)
-        parsed_response.meta = parsed_response.meta.merge(response.meta)
+        parsed_response.meta._update(response.meta, seen_tags)
     return parsed_response
 
 
@@ -97,12 +122,19 @@ def parse_response(
             "Response does not contain dates. Probably the request was invalid."
         )
     meta = parse_meta(response)
-    records: RecordDict = collections.defaultdict(dict)
+    records: RecordDict = {}
     errors: List[Error] = []
+    currencies = meta.currencies
     for data_type_value in response.data_type_values:
         field = data_type_value.data_type
         for symbol_value in data_type_value.symbol_values:
-            meta.currencies[symbol_value.symbol][field] = symbol_value.currency
+            currency = symbol_value.currency
+            if currency is not None:
+                symbol = symbol_value.symbol
+                symbol_currencies = currencies.get(symbol)
+                if symbol_currencies is None:
+                    symbol_currencies = currencies[symbol] = {}
+                symbol_currencies[field] = currency
             process_symbol_value(
                 records,
                 errors,
@@ -112,10 +144,12 @@ def parse_response(
                 process_strings=process_strings,
             )
     record_list = []
-    for (symbol, date), record in records.items():
-        record["symbol"] = symbol
-        record["date"] = date
-        record_list.append(record)
+    for symbol, symbol_records in records.items():
+        for date, record in zip(dates, symbol_records):
+            if record:
+                record["symbol"] = symbol
+                record["date"] = date
+                record_list.append(record)
     return ParsedResponse(record_list, errors, meta)
 
 
@@ -129,52 +163,58 @@ def process_symbol_value(  # noqa: PLR0913
     process_strings: bool,
 ) -> None:
     """Parse a symbol value into a dictionary."""
-    is_error = isinstance(symbol_value, DSError)
+    # msgspec always decodes to the exact tagged class, so compare types directly
+    value_type = type(symbol_value)
+    is_error = value_type is DSError
     if is_error:
         errors.append(Error(field, symbol_value.symbol, symbol_value.value))  # type: ignore[arg-type]
     value = symbol_value.parse()
-    if isinstance(symbol_value, DSString) and process_strings:
+    if process_strings and value_type is DSString:
         value = process_string_value(value)  # type: ignore[arg-type]
     if isinstance(value, list):
         if len(value) != len(dates):
             raise InvalidResponseError(
                 "Number of values does not match number of dates."
             )
-        for date, xvalue in zip(dates, value):
-            records[(symbol_value.symbol, date)][field] = xvalue
+        symbol_records = _symbol_records(records, symbol_value.symbol, len(dates))
+        for record, xvalue in zip(symbol_records, value):
+            record[field] = xvalue
     else:
         if len(dates) > 1 and not is_error:
             raise InvalidResponseError("More than one date found for single value.")
-        records[(symbol_value.symbol, dates[0])][field] = value
+        symbol_records = _symbol_records(records, symbol_value.symbol, len(dates))
+        symbol_records[0][field] = value
+
+
+def _symbol_records(
+    records: RecordDict,
+    symbol: str,
+    n_dates: int,
+) -> List[Dict[str, Any]]:
+    """Return the records of a symbol, creating them if needed."""
+    symbol_records = records.get(symbol)
+    if symbol_records is None:
+        symbol_records = records[symbol] = [{} for _ in range(n_dates)]
+    return symbol_records
 
 
 def parse_meta(response: DSDataResponse) -> Meta:
     """Parse meta information from a response."""
-    meta = Meta()
-    if response.data_type_names:
-        meta.data_type_names = {
-            kv_pair.key or kv_pair.value: kv_pair.value
-            for kv_pair in response.data_type_names
-        }
-    if response.symbol_names:
-        meta.symbol_names = {
-            kv_pair.key or kv_pair.value: kv_pair.value
-            for kv_pair in response.symbol_names
-        }
-    if response.additional_responses:
-        meta.additional_responses = {
-            kv_pair.key or kv_pair.value: kv_pair.value
-            for kv_pair in response.additional_responses
-        }
-    if response.tag:
-        meta.tags.append(response.tag)
-    return meta
+    return Meta(
+        data_type_names=_kv_pairs_to_dict(response.data_type_names),
+        symbol_names=_kv_pairs_to_dict(response.symbol_names),
+        additional_responses=_kv_pairs_to_dict(response.additional_responses),
+        tags=[response.tag] if response.tag else [],
+    )
+
+
+def _kv_pairs_to_dict(kv_pairs: Optional[List[DSStringKVPair]]) -> Dict[str, Any]:
+    """Convert a list of key-value pairs to a dict keyed by key (or value)."""
+    if not kv_pairs:
+        return {}
+    return {kv_pair.key or kv_pair.value: kv_pair.value for kv_pair in kv_pairs}
 
 
 def process_string_value(value: str) -> Optional[Union[str, bool]]:
     """Process a string value further."""
-    return {
-        "NA": None,
-        "N": False,
-        "Y": True,
-    }.get(value, value)
+    return STRING_VALUE_MAPPING.get(value, value)
@@ -5,8 +5,10 @@ import msgspec
 
 DateType = Union[dt.date, str]
 
+_EXPIRY_SKEW = dt.timedelta(minutes=1)
 
-class DSStringKVPair(msgspec.Struct, rename="pascal", frozen=True):
+
+class DSStringKVPair(msgspec.Struct, rename="pascal", frozen=True, gc=False):
     """A key-value pair."""
 
     key: Optional[str]
@@ -19,9 +21,12 @@ class Token(msgspec.Struct, frozen=True):
     token_value: str
     token_expiry: dt.datetime
 
+    @property
+    def ttl_seconds(self) -> float:
+        """Return the number of seconds until the token expires."""
+        return (self.token_expiry - dt.datetime.now(tz=dt.timezone.utc)).total_seconds()
+
     @property
     def is_expired(self) -> bool:
         """Return True if the token is expired."""
-        return (self.token_expiry + dt.timedelta(minutes=1)) < dt.datetime.now(
-            tz=dt.timezone.utc
-        )
+        return (self.token_expiry + _EXPIRY_SKEW) < dt.datetime.now(tz=dt.timezone.utc)
@@ -1,9 +1,15 @@
 import datetime as dt
+import logging
 import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 from dsws_client import DSWSClient
+from dsws_client.value_objects import DSStringKVPair, Token
 
 load_dotenv()
 
@@ -83,3 +89,196 @@ def test_fetch_timeseries_data(client: DSWSClient, tag: str) -> None:
     assert len(response.meta.symbol_names) == 2
     assert len(response.meta.additional_responses) == 1
     assert len(response.meta.tags) == 1
+
+
+def test_construct_request_returns_fresh_objects() -> None:
+    """Verify mutating a constructed request does not leak into later ones."""
+    extra = DSStringKVPair("Extra", value=True)
+    with DSWSClient("username", "password") as client:
+        request = client.construct_request("VOD", ["P"], None, None, "D", 1)
+        bundles = client.construct_request_bundles(["VOD"], ["P"], None, None, "D", 1)
+        bundle_request = bundles[0][0]
+        expected_properties = (
+            list(request.instrument.properties),
+            list(request.data_types[0].properties),
+            list(bundle_request.instrument.properties),
+        )
+        request.instrument.properties.append(extra)
+        request.data_types[0].properties.append(extra)
+        bundle_request.instrument.properties.append(extra)
+        bundle_request.data_types[0].properties.append(extra)
+
+        fresh_request = client.construct_request("VOD", ["P"], None, None, "D", 1)
+        fresh_bundles = client.construct_request_bundles(
+            ["VOD"], ["P"], None, None, "D", 1
+        )
+
+    assert (
+        fresh_request.instrument.properties,
+        fresh_request.data_types[0].properties,
+        fresh_bundles[0][0].instrument.properties,
+    ) == expected_properties
+    assert fresh_bundles[0][0].data_types[0].properties == expected_properties[1]
+
+
+def test_request_logging_redacts_credentials(
+    caplog: pytest.LogCaptureFixture,
+    timeseries_response: Dict[str, Any],
+) -> None:
+    """Verify debug logging does not leak the password or token."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        """Respond to token and data requests."""
+        if request.url.path.endswith("GetToken"):
+            return httpx.Response(
+                200,
+                json={
+                    "TokenValue": "secret-token",
+                    "TokenExpiry": "/Date(4102444800000+0000)/",
+                    "Properties": None,
+                },
+            )
+        return httpx.Response(
+            200,
+            json={"DataResponse": timeseries_response, "Properties": None},
+        )
+
+    with DSWSClient("username", "secret-password") as client:
+        client._session = httpx.Client(
+            base_url=client._session.base_url,
+            transport=httpx.MockTransport(handler),
+        )
+        data_request = client.construct_request("VOD", ["P"], None, None, "D", 1)
+        with caplog.at_level(logging.DEBUG, logger="dsws_client"):
+            client.fetch_one(data_request)
+
+    assert "username" in caplog.text
+    assert "VOD" in caplog.text
+    assert "secret-password" not in caplog.text
+    assert "secret-token" not in caplog.text
+
+
+def test_debug_option_deprecated() -> None:
+    """Verify the debug option warns and enables debug logging."""
+    package_logger = logging.getLogger("dsws_client")
+    with pytest.warns(DeprecationWarning, match="debug"):
+        DSWSClient("username", "password", debug=True).close()
+    try:
+        assert package_logger.isEnabledFor(logging.DEBUG)
+    finally:
+        package_logger.setLevel(logging.NOTSET)
+        for handler in package_logger.handlers[:]:
+            package_logger.removeHandler(handler)
+
+
+def test_debug_option_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify a falsy DEBUG environment variable does not warn."""
+    monkeypatch.setenv("DEBUG", "0")
+
+    DSWSClient("username", "password").close()
+
+
+STALE_TOKEN = "stale"  # noqa: S105
+
+
+class FakeTokenFetcher:
+    """Hand out numbered tokens, optionally blocking until released."""
+
+    def __init__(self, *, block: bool = False) -> None:
+        self.calls: List[str] = []
+        self.issued: List[str] = []
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self) -> Token:
+        """Return a new token valid for an hour."""
+        self.calls.append(threading.current_thread().name)
+        self.release.wait(timeout=5)
+        self.issued.append(f"token-{len(self.calls)}")
+        return Token(
+            self.issued[-1],
+            dt.datetime.now(tz=dt.timezone.utc) + dt.timedelta(hours=1),
+        )
+
+
+@pytest.fixture(name="offline_client")
+def offline_client_fix() -> Iterator[DSWSClient]:
+    """Provide a DSWSClient that is closed after the test."""
+    with DSWSClient("username", "password") as client:
+        yield client
+
+
+def test_token_first_call_fetches_synchronously(
+    offline_client: DSWSClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify the first token access fetches a token in the calling thread."""
+    fetcher = FakeTokenFetcher()
+    monkeypatch.setattr(offline_client, "fetch_token", fetcher)
+
+    assert offline_client.token == fetcher.issued[0]
+    assert offline_client.token == fetcher.issued[0]
+    assert fetcher.calls == [threading.current_thread().name]
+    assert offline_client._token_thread is None
+
+
+def test_token_refreshes_once_in_background(
+    offline_client: DSWSClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify a token close to expiry is returned while one refresh runs."""
+    fetcher = FakeTokenFetcher(block=True)
+    monkeypatch.setattr(offline_client, "fetch_token", fetcher)
+    offline_client._token_value = STALE_TOKEN
+    offline_client._token_refresh_at = time.monotonic() - 1
+    offline_client._token_deadline = time.monotonic() + 60
+
+    assert [offline_client.token for _ in range(5)] == [STALE_TOKEN] * 5
+
+    fetcher.release.set()
+    assert offline_client._token_thread is not None
+    offline_client._token_thread.join(timeout=5)
+    assert fetcher.calls == ["dsws-token-refresh"]
+    assert offline_client.token == fetcher.issued[0]
+
+
+def test_token_past_deadline_blocks(
+    offline_client: DSWSClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify an expired token is refreshed before being returned."""
+    fetcher = FakeTokenFetcher()
+    monkeypatch.setattr(offline_client, "fetch_token", fetcher)
+    offline_client._token_value = STALE_TOKEN
+    offline_client._token_refresh_at = time.monotonic() - 60
+    offline_client._token_deadline = time.monotonic() - 1
+
+    assert offline_client.token == fetcher.issued[0]
+    assert fetcher.calls == [threading.current_thread().name]
+
+
+def test_close_waits_for_background_refresh(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Verify closing the client lets a background refresh finish first."""
+    client = DSWSClient("username", "password")
+    session_closed_during_fetch = []
+
+    def fetch_token() -> Token:
+        """Return a token after a short delay."""
+        time.sleep(0.05)
+        session_closed_during_fetch.append(client._session.is_closed)
+        return Token("fresh", dt.datetime.now(tz=dt.timezone.utc))
+
+    monkeypatch.setattr(client, "fetch_token", fetch_token)
+    client._token_refresh_at = time.monotonic() - 1
+    client._token_deadline = time.monotonic() + 60
+    _ = client.token
+    token_thread = client._token_thread
+    client.close()
+
+    assert token_thread is not None
+    assert not token_thread.is_alive()
+    assert session_closed_during_fetch == [False]
+    # no new background refreshes are started once closed
+    _ = client.token
+    assert client._token_thread is token_thread
@@ -0,0 +1,75 @@
+import datetime as dt
+
+import pytest
+from dsws_client.converters import convert_date
+
+
+@pytest.mark.parametrize(
+    ("date_str", "expected"),
+    [
+        (
+            "/Date(1577836800000)/",
+            dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc),
+        ),
+        (
+            "/Date(1577836800000+0000)/",
+            dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc),
+        ),
+        (
+            "/Date(1577836800000+0130)/",
+            dt.datetime(
+                2020,
+                1,
+                1,
+                1,
+                30,
+                tzinfo=dt.timezone(dt.timedelta(hours=1, minutes=30)),
+            ),
+        ),
+        (
+            "/Date(1577836800000-0500)/",
+            dt.datetime(2019, 12, 31, 19, tzinfo=dt.timezone(dt.timedelta(hours=-5))),
+        ),
+        # not in the "/Date(...)/" wrapper, handled by the regex fallback
+        (
+            "1577836800000+0130",
+            dt.datetime(
+                2020,
+                1,
+                1,
+                1,
+                30,
+                tzinfo=dt.timezone(dt.timedelta(hours=1, minutes=30)),
+            ),
+        ),
+        (
+            "\\/Date(1577836800000)\\/",
+            dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc),
+        ),
+        # dates before the epoch
+        (
+            "/Date(-86400000)/",
+            dt.datetime(1969, 12, 31, tzinfo=dt.timezone.utc),
+        ),
+        (
+            "/Date(-86400000-0500)/",
+            dt.datetime(1969, 12, 30, 19, tzinfo=dt.timezone(dt.timedelta(hours=-5))),
+        ),
+        (
+            "-86400000+0000",
+            dt.datetime(1969, 12, 31, tzinfo=dt.timezone.utc),
+        ),
+    ],
+)
+def test_convert_date(date_str: str, expected: dt.datetime) -> None:
+    """Verify Datastream date strings are converted to datetimes."""
+    converted = convert_date(date_str)
+
+    assert converted == expected
+    assert converted.utcoffset() == expected.utcoffset()
+
+
+def test_convert_date_invalid() -> None:
+    """Verify converting an invalid date string raises an error."""
+    with pytest.raises(ValueError, match="invalid date string"):
+        convert_date("/Date()/")
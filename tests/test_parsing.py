@@ -4,7 +4,14 @@ import msgspec
 import pytest
 from dsws_client.ds_response import DSDataResponse, DSDoubleArray
 from dsws_client.exceptions import InvalidResponseError
-from dsws_client.parse import parse_response, process_string_value, process_symbol_value
+from dsws_client.parse import (
+    Meta,
+    ParsedResponse,
+    aggregate_responses,
+    parse_response,
+    process_string_value,
+    process_symbol_value,
+)
 
 
 def test_invalid_response(invalid_response: Dict[str, Any]) -> None:
@@ -15,6 +22,40 @@ def test_invalid_response(invalid_response: Dict[str, Any]) -> None:
         parse_response(response)
 
 
+def test_parse_timeseries_response(timeseries_response: Dict[str, Any]) -> None:
+    """Verify a timeseries response is parsed into one record per date."""
+    response = msgspec.convert(timeseries_response, type=DSDataResponse)
+
+    parsed = parse_response(response)
+
+    assert [record["P"] for record in parsed.records] == [
+        92.71,
+        92.01,
+        90.79,
+        89.81,
+        90.66,
+        89.68,
+    ]
+    assert all(record["symbol"] == "VOD" for record in parsed.records)
+    assert [record["date"] for record in parsed.records] == response.pydates()
+    assert parsed.errors == []
+
+
+def test_parse_snapshot_response(snapshot_response: Dict[str, Any]) -> None:
+    """Verify a snapshot response is parsed into one record per symbol."""
+    response = msgspec.convert(snapshot_response, type=DSDataResponse)
+
+    parsed = parse_response(response)
+
+    assert [
+        (record["symbol"], record["NAME"], record["ISIN"]) for record in parsed.records
+    ] == [
+        ("VOD", "VODAFONE GROUP", "GB00BH4HKS39"),
+        ("U:JPM", "JP MORGAN CHASE & CO.", "US46625H1005"),
+    ]
+    assert parsed.meta.tags == ["test"]
+
+
 def test_process_response_invalid_value() -> None:
     """Verify processing a value raises an exception if invalid."""
     symbol_value = DSDoubleArray(
@@ -34,3 +75,44 @@ def test_process_response_invalid_value() -> None:
 def test_process_string_value(value: str, expected: Optional[Union[str, bool]]) -> None:
     """Verify strings are cast to correct type."""
     assert process_string_value(value) == expected
+
+
+def test_meta_update() -> None:
+    """Verify meta objects are updated in place without duplicating tags."""
+    meta = Meta(
+        symbol_names={"VOD": "VODAFONE"},
+        tags=["a"],
+        currencies={"BP": {"MV": "£"}},
+    )
+    other = Meta(
+        symbol_names={"BP": "BP"},
+        tags=["a", "b"],
+        currencies={"BP": {"P": "£"}},
+    )
+
+    meta.update(other)
+
+    assert meta.symbol_names == {"VOD": "VODAFONE", "BP": "BP"}
+    assert meta.tags == ["a", "b"]
+    assert meta.currencies == {"BP": {"MV": "£", "P": "£"}}
+
+
+def test_meta_merge() -> None:
+    """Verify merging meta objects matches updating a copy in place."""
+    meta = Meta(tags=["b", "a"], currencies={"BP": {"MV": "£"}})
+    other = Meta(tags=["c", "a"], currencies={"BP": {"P": "£"}})
+
+    merged = meta.merge(other)
+
+    assert merged.tags == ["b", "a", "c"]
+    assert merged.currencies == {"BP": {"MV": "£", "P": "£"}}
+    assert meta == Meta(tags=["b", "a"], currencies={"BP": {"MV": "£"}})
+
+
+def test_aggregate_responses_tags() -> None:
+    """Verify aggregated tags are deduplicated in first-seen order."""
+    responses = [
+        ParsedResponse(meta=Meta(tags=tags)) for tags in (["b"], ["a", "b"], ["c", "a"])
+    ]
+
+    assert aggregate_responses(responses).meta.tags == ["b", "a", "c"]
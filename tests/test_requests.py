@@ -7,11 +7,13 @@ from dsws_client.ds_request import (
     MAX_DATATYPES_PER_REQUEST,
     MAX_INSTRUMENTS_PER_REQUEST,
     MAX_ITEMS_PER_BUNDLE,
+    MAX_ITEMS_PER_REQUEST,
     DSDataRequest,
     DSDataType,
     DSDate,
     DSGetDataBundleRequest,
     DSInstrument,
+    bundle_identifiers,
 )
 from dsws_client.value_objects import (
     DSDateName,
@@ -179,3 +181,25 @@ def test_construct_instrument(
         *expected_properties,
         DSStringKVPair(DSInstrumentPropertyName.RETURN_NAME, value=True),
     ]
+
+
+@pytest.mark.parametrize("n_fields", [1, 3, 7, MAX_DATATYPES_PER_REQUEST])
+def test_bundle_identifiers(n_fields: int) -> None:
+    """Verify identifiers are bundled within the request and bundle limits."""
+    identifiers = [f"ID{idx}" for idx in range(1234)]
+    instrument = DSInstrument.construct(identifiers, return_names=True)
+
+    bundles = bundle_identifiers(instrument, n_fields)
+
+    assert [
+        identifier
+        for bundle in bundles
+        for bundle_instrument in bundle
+        for identifier in bundle_instrument.identifiers
+    ] == identifiers
+    for bundle in bundles:
+        assert sum(len(item) for item in bundle) * n_fields <= MAX_ITEMS_PER_BUNDLE
+        for bundle_instrument in bundle:
+            assert len(bundle_instrument) <= MAX_INSTRUMENTS_PER_REQUEST
+            assert len(bundle_instrument) * n_fields <= MAX_ITEMS_PER_REQUEST
+            assert bundle_instrument.properties == instrument.properties
@@ -1,13 +1,16 @@
+import datetime as dt
 from typing import Any, Dict
 
 import msgspec
 import pytest
 from dsws_client.ds_response import (
     DSDataResponse,
+    DSDateTime,
     DSGetDataBundleResponse,
     DSGetDataResponse,
     DSGetTokenResponse,
 )
+from dsws_client.value_objects import Token
 
 
 @pytest.fixture(name="token_response_dict")
@@ -58,3 +61,28 @@ def test_init_get_data_bundle_response(timeseries_response: Dict[str, Any]) -> N
             type=DSDataResponse,
         )
     ]
+
+
+def test_token_ttl() -> None:
+    """Verify the token TTL is computed from its expiry."""
+    now = dt.datetime.now(tz=dt.timezone.utc)
+    token = Token("token", now + dt.timedelta(minutes=10))
+    expired_token = Token("token", now - dt.timedelta(minutes=10))
+
+    assert 0 < token.ttl_seconds <= 600
+    assert expired_token.ttl_seconds < 0
+
+
+def test_date_time_before_epoch() -> None:
+    """Verify date values before 1970 are accepted and parsed."""
+    value = msgspec.convert(
+        {
+            "Currency": None,
+            "Symbol": "VOD",
+            "Type": 4,
+            "Value": "/Date(-86400000+0000)/",
+        },
+        type=DSDateTime,
+    )
+
+    assert value.parse() == dt.datetime(1969, 12, 31, tzinfo=dt.timezone.utc)